@@ -1,15 +1,49 @@
 import os
+import re
+import shutil
 import requests
-from datetime import datetime
+from functools import partial
+from typing import Optional
 from loguru import logger
 from mutagen.flac import FLAC, Picture
 import mutagen.id3 as id3
 from mutagen.id3 import ID3NoHeaderError
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from rsack.clients import bugs
 from rsack.utils import Settings, track_to_flac, insert_total_tracks, contribution_check, sanitize, _format_date
 
+# Legend contains all ID3 tags for each FLAC header.
+_ID3_LEGEND = {
+    "ALBUM": id3.TALB,
+    "ALBUMARTIST": id3.TPE2,
+    "ARTIST": id3.TPE1,
+    "COMMENT": id3.COMM,
+    "COMPOSER": id3.TCOM,
+    "COPYRIGHT": id3.TCOP,
+    "DATE": id3.TDRC,
+    "GENRE": id3.TCON,
+    "ISRC": id3.TSRC,
+    "LABEL": id3.TPUB,
+    "PERFORMER": id3.TOPE,
+    "TITLE": id3.TIT2,
+    "LYRICS": id3.USLT
+}
+
+# Matches every {key} in the path template, unknown keys are left untouched.
+_TEMPLATE_KEYS = re.compile(r"\{(\w+)\}")
+
+
+def _padding(info, reserve: int) -> int:
+    """Keeps existing padding when the tags fit, otherwise reserves room so later edits don't rewrite the audio"""
+    return info.padding if info.padding >= 0 else reserve
+
+
+def _lrc_timestamp(seconds: str) -> str:
+    """Formats a timed lyrics offset in seconds as mm:ss.xx"""
+    minutes, centiseconds = divmod(round(float(seconds) * 100), 6000)
+    return f"{minutes:02d}:{centiseconds // 100:02d}.{centiseconds % 100:02d}"
+
 
 class Download:
     def __init__(self, type: str, id: int):
@@ -23,10 +57,50 @@ class Download:
         self.client = bugs.Client(proxy=self.settings['proxy'])
         self.conn_info = self.client.auth(email=self.settings['email'], password=self.settings['password'])
         logger.info(f"Threads: {self.settings['threads']}")
-        if type == "artist":
-            self._artist(id)
-        elif type == "album":
-            self._album(id)
+        self.chunk_size = int(self.settings.get('chunk_size', 1024 * 1024))
+        # Ranged requests used per track, positioned writes require os.pwrite
+        self.segments = int(self.settings.get('segments', 1)) if hasattr(os, 'pwrite') else 1
+        self.session = self._create_session(int(self.settings['threads']) * max(self.segments, 2))
+        if self.segments > 1:
+            self._segment_pool = ThreadPoolExecutor(max_workers=int(self.settings['threads']) * self.segments)
+        # Track downloads share one pool across every album
+        self._pool = ThreadPoolExecutor(max_workers=int(self.settings['threads']))
+        # Secondary pool for cover/lyric requests that run alongside track downloads
+        self._io_pool = ThreadPoolExecutor(max_workers=int(self.settings['threads']) + 1)
+        try:
+            if type == "artist":
+                self._artist(id)
+            elif type == "album":
+                self._album(id)
+        except Exception as e:
+            logger.exception(e)
+        finally:
+            self._pool.shutdown()
+            self._io_pool.shutdown()
+            if self.segments > 1:
+                self._segment_pool.shutdown()
+
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        """Creates a pooled session shared by track, cover and lyric requests
+
+        Args:
+            pool_size (int): Maximum number of concurrent connections per host.
+
+        Returns:
+            requests.Session: Session with keep-alive connection pooling
+        """
+        session = requests.Session()
+        retry_strategy = requests.packages.urllib3.util.retry.Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            method_whitelist=["HEAD", "GET", "OPTIONS"]
+        )
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry_strategy)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
 
     def _artist(self, id: int):
         """Handle artist downloads
@@ -40,35 +114,59 @@ class Download:
         """
         artist = self.client.get_artist(id)
         logger.info(f"{len(artist['list'][1]['artist_album']['list'])} releases found")
+        album_ids = []
         for album in artist['list'][1]['artist_album']['list']:
             contribution = contribution_check(id, int(album['artist_id']))
-            if contribution:
-                if self.settings['contributions']:
-                    self._album(album['album_id'])
-                else:
-                    logger.debug("Skipping album contribution")
+            if contribution and not self.settings['contributions']:
+                logger.debug("Skipping album contribution")
             else:
-                self._album(album['album_id'])
+                album_ids.append(album['album_id'])
+        # Albums are downloaded one at a time as their state lives on self,
+        # but the next album's metadata is fetched while the current one downloads.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(self.client.get_album, album_ids[0]) if album_ids else None
+            for i, album_id in enumerate(album_ids):
+                meta = pending
+                if i + 1 < len(album_ids):
+                    pending = executor.submit(self.client.get_album, album_ids[i + 1])
+                # A failed album is logged and the rest of the artist carries on
+                try:
+                    self._album(album_id, meta.result())
+                except Exception as e:
+                    logger.exception(e)
                 
-    def _album(self, id: int):
+    def _album(self, id: int, meta: dict = None):
         """Handle album downloads
 
         Args:
             id (int): Unique album id
+            meta (dict, optional): Prefetched self.client.get_album() response. Defaults to None.
         """
-        self.album = self.client.get_album(id)['list'][0]['album_info']['result']
+        if meta is None:
+            meta = self.client.get_album(id)
+        self.album = meta['list'][0]['album_info']['result']
         logger.info(f"Album: {self.album['title']}")
         # Acquire disc total
         self.album['disc_total'] = self.album['tracks'][-1]['disc_id']
         # Add track_total to meta.
         insert_total_tracks(self.album['tracks'])
         self._album_path()
-        self._download_cover()
+        # Download cover artwork alongside the tracks, _tag() waits on it before embedding
+        self._cover = self._io_pool.submit(self._download_cover)
+        # Request lyrics for every missing track up-front, _download() collects them before tagging
+        self._lyrics = {track['track_id']: self._io_pool.submit(self._get_lyrics, track['track_id'], track['lyrics_tp'])
+                        for track in self.album['tracks'] if not self._exist_check(self._track_path(track))}
         # Begin downloading tracks
-        with ThreadPoolExecutor(max_workers=int(self.settings['threads'])) as executor:
-            executor.map(self._download, self.album['tracks'])
+        futures = [self._pool.submit(self._download, track) for track in self.album['tracks']]
+        for i, future in enumerate(as_completed(futures), 1):
+            # A failed track is logged and the rest of the album carries on
+            try:
+                future.result()
+            except Exception as e:
+                logger.exception(e)
+            logger.debug(f"{i}/{len(futures)} tracks processed")
+        self._cover.result()
     
-    @logger.catch
     def _template(self):
         keys = {
             "artist": self.album['artist_disp_nm'],
@@ -80,12 +178,8 @@ class Download:
             "artist_id": str(self.album['artist_id']),
             "type": self.album['album_tp'],
         }
-        template = self.settings['template']
-        for k in keys:
-            template = template.replace(f"{{{k}}}", sanitize(keys[k]))
-        return template
+        return _TEMPLATE_KEYS.sub(lambda m: sanitize(keys[m.group(1)]) if m.group(1) in keys else m.group(0), self.settings['template'])
             
-    @logger.catch
     def _album_path(self):
         """Creates necessary directories"""
         self.album_path = self.settings['path'] + self._template()
@@ -109,14 +203,38 @@ class Download:
         # Create nested disc folders
         if self.album['disc_total'] > 1:
             self.discs = True
-            for i in range(self.album['disc_total']):
-                d = os.path.join(self.album_path, f"Disc {str(i + 1)}")
+            self._disc_dirs = [os.path.join(self.album_path, f"Disc {i + 1}") for i in range(self.album['disc_total'])]
+            for d in self._disc_dirs:
                 if not os.path.exists(d):
                     os.makedirs(d)
         else: 
             self.discs = False
+            self._disc_dirs = [self.album_path]
+        self._scan_existing()
+
+    def _scan_existing(self):
+        """Caches the size of every file already present in the album folders"""
+        self._existing = {}
+        # Album folder holds the cover artwork, and the tracks unless they are split into discs
+        dirs = [self.album_path, *self._disc_dirs] if self.discs else self._disc_dirs
+        for d in dirs:
+            with os.scandir(d) as it:
+                for entry in it:
+                    if entry.is_file():
+                        self._existing[entry.path] = entry.stat().st_size
+
+    def _track_path(self, track: dict) -> str:
+        """Returns the .temp file path of a track
+
+        Args:
+            track (dict): Contains track information from API response
+
+        Returns:
+            str: .temp file path
+        """
+        directory = self._disc_dirs[track['disc_id'] - 1 if self.discs else 0]
+        return os.path.join(directory, f"{track['track_no']:02d}. {sanitize(track['track_title'])}.temp")
 
-    @logger.catch
     def _download(self, track: dict):
         """Downloads track
 
@@ -126,10 +244,7 @@ class Download:
         if track['is_flac_str_premium'] and not self.client.premium:
             logger.warning("Lossless is only available for Premium users, MP3 will be downloaded.")
         logger.info(f"Track: {track['track_title']}")
-        if self.discs:
-            file_path = os.path.join(self.album_path, f"Disc {str(track['disc_id'])}", f"{track['track_no']:02d}. {sanitize(track['track_title'])}.temp")
-        else:
-            file_path = os.path.join(self.album_path, f"{track['track_no']:02d}. {sanitize(track['track_title'])}.temp")
+        file_path = self._track_path(track)
         if self._exist_check(file_path):
             logger.debug(f"{track['track_title']} already exists")
         else:
@@ -141,32 +256,134 @@ class Download:
                 "track_id": track['track_id']
             }
             # Create headers for byte position.
+            offset = self._return_bytes(file_path)
             headers = {
-                "Range": 'bytes=%d-' % self._return_bytes(file_path),
+                "Range": 'bytes=%d-' % offset,
             }
-            r = requests.get(f"http://api.bugs.co.kr/3/tracks/{track['track_id']}/listen/android/flac", headers=headers, params=params, stream=True)
-            if r.url.split("?")[0].endswith(".mp3"): # If response redirects to MP3 file set quality to .mp3
-                quality = '.mp3'
-            elif r.url.split("?")[0].endswith(".m4a"):
-                quality = '.m4a' 
-            else: # Otherwise .flac
-                quality = '.flac'
-            if quality != '.m4a':
-                if r.status_code == 404:
-                    logger.info(f"{track['track_title']} unavailable")
-                else:
-                    with open(file_path, 'ab') as f:
-                        for chunk in r.iter_content(32 * 1024):
-                            if chunk:
-                                f.write(chunk)
-                    c_path = file_path.replace(".temp", quality)
-                    os.rename(file_path, c_path)
-                    self._tag(track, c_path)
-            else:
+            # Resolve the redirect without pulling a body to rule out unavailable tracks
+            head = self.session.head(f"http://api.bugs.co.kr/3/tracks/{track['track_id']}/listen/android/flac", params=params, allow_redirects=True)
+            available = head.status_code != 404 and self._quality(head.url) != '.m4a'
+            size = self._range_size(head)
+            r = None
+            # Only open a streaming GET when the track won't be split into segments
+            if available and not (self.segments > 1 and offset == 0 and size):
+                r = self.session.get(head.url, headers=headers, stream=True)
+                if r.status_code == 404 or self._quality(r.url) == '.m4a':
+                    r.close()
+                    available = False
+            if not available:
                 logger.info(f"{track['track_title']} is unavailable.")
+                # Drop the prefetched lyrics if the request hasn't started yet
+                self._lyrics[track['track_id']].cancel()
+            else:
+                if r is None:
+                    # Server honours ranges, split the track across multiple connections
+                    quality = self._quality(head.url)
+                    self._download_segments(head.url, file_path, size)
+                else:
+                    quality = self._quality(r.url)
+                    if r.status_code == 416:
+                        # Nothing past the resume offset, the .temp file is already complete
+                        r.close()
+                    else:
+                        # Never append an error page to a resumable .temp file
+                        r.raise_for_status()
+                        r.raw.decode_content = True
+                        with open(file_path, 'ab', buffering=0) as f:
+                            shutil.copyfileobj(r.raw, f, self.chunk_size)
+                c_path = file_path.replace(".temp", quality)
+                os.rename(file_path, c_path)
+                self._tag(track, c_path, self._lyrics[track['track_id']].result())
+
+    @staticmethod
+    def _quality(url: str) -> str:
+        """Returns the file extension of a resolved track URL
+
+        Args:
+            url (str): Track URL after redirects
+
+        Returns:
+            str: '.mp3'/'.m4a', otherwise '.flac'
+        """
+        path = url.split("?")[0]
+        if path.endswith(".mp3"): # If response redirects to MP3 file set quality to .mp3
+            return '.mp3'
+        elif path.endswith(".m4a"):
+            return '.m4a'
+        else: # Otherwise .flac
+            return '.flac'
 
     @staticmethod
-    def _return_bytes(file_path: str) -> int:
+    def _range_size(head: requests.Response) -> int:
+        """Returns the size of a file that can be fetched in byte ranges
+
+        Args:
+            head (requests.Response): HEAD response for the resolved track URL
+
+        Returns:
+            int: Size in bytes, 0 if the server doesn't advertise range support
+        """
+        if head.status_code != 200 or head.headers.get('Accept-Ranges') != 'bytes':
+            return 0
+        size = head.headers.get('Content-Length', '')
+        return int(size) if size.isdigit() else 0
+
+    def _download_segments(self, url: str, file_path: str, size: int):
+        """Downloads a file over multiple concurrent ranged requests
+
+        Segments are written out of order into a .part file which only becomes the
+        .temp file once every segment has finished, so its size is never used as a
+        resume offset.
+
+        Args:
+            url (str): Resolved track URL
+            file_path (str): .temp file path
+            size (int): Full size of the file in bytes
+        """
+        step = -(-size // self.segments)
+        part_path = file_path.replace('.temp', '.part')
+        fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # Reserve the whole .part file up-front so out of order segment writes don't fragment it.
+            # Only the .part file is preallocated, the resumable .temp file always reflects bytes written.
+            if hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(fd, 0, size)
+                except OSError as exc:
+                    logger.debug(f"Preallocation unavailable: {exc}")
+            futures = [self._segment_pool.submit(self._download_segment, url, fd, start, min(start + step, size) - 1)
+                       for start in range(0, size, step)]
+            for future in futures:
+                future.result()
+        except BaseException:
+            # Segments are written out of order so the .part file can't be resumed
+            os.close(fd)
+            os.remove(part_path)
+            raise
+        os.close(fd)
+        os.replace(part_path, file_path)
+
+    def _download_segment(self, url: str, fd: int, start: int, end: int):
+        """Writes a single byte range of a file
+
+        Args:
+            url (str): Resolved track URL
+            fd (int): File descriptor of the .part file
+            start (int): First byte of the range
+            end (int): Last byte of the range (inclusive)
+        """
+        with self.session.get(url, headers={"Range": f"bytes={start}-{end}"}, stream=True) as r:
+            r.raise_for_status()
+            if r.status_code != 206:
+                raise requests.HTTPError(f"Range request returned {r.status_code}", response=r)
+            for chunk in r.iter_content(self.chunk_size):
+                os.pwrite(fd, chunk, start)
+                start += len(chunk)
+        # A connection closed early just ends the stream, leaving a hole in the preallocated file
+        if start != end + 1:
+            raise requests.exceptions.ChunkedEncodingError(f"Segment ended at byte {start}, expected {end + 1}")
+
+    def _return_bytes(self, file_path: str) -> int:
         """Returns number of bytes in file
 
         Args:
@@ -175,15 +392,12 @@ class Download:
         Returns:
             int: Returns size in bytes
         """
-        
-        if os.path.exists(file_path):
+        size = self._existing.get(file_path, 0)
+        if size:
             logger.debug(f"Existing .temp file {os.path.basename(file_path)} has resumed.")
-            return os.path.getsize(file_path)
-        else:
-            return 0
+        return size
     
-    @staticmethod
-    def _exist_check(file_path: str) -> bool:
+    def _exist_check(self, file_path: str) -> bool:
         """Check if file exists for both possible cases
 
         Args:
@@ -192,9 +406,9 @@ class Download:
         Returns:
             bool: True if exists else false
         """
-        if os.path.exists(file_path.replace('.temp', '.mp3')):
+        if file_path.replace('.temp', '.mp3') in self._existing:
             return True
-        if os.path.exists(file_path.replace('.temp', '.flac')):
+        if file_path.replace('.temp', '.flac') in self._existing:
             return True
         else:
             return False
@@ -202,57 +416,58 @@ class Download:
     def _download_cover(self):
         """Downloads cover artwork"""
         self.cover_path = os.path.join(self.album_path, 'cover.jpg')
-        if os.path.exists(self.cover_path):
+        if self.cover_path in self._existing:
             logger.info('Cover already exists')
         else:
-            r = requests.get(self.album['img_urls'][self.settings['cover_size']])
-            r.raise_for_status
-            with open(self.cover_path, 'wb') as f:
-                f.write(r.content)
+            # Stream to a temporary name so an interrupted download never passes as an existing cover
+            part_path = self.cover_path + '.part'
+            try:
+                with self.session.get(self.album['img_urls'][self.settings['cover_size']], stream=True) as r:
+                    r.raise_for_status()
+                    r.raw.decode_content = True
+                    with open(part_path, 'wb') as f:
+                        shutil.copyfileobj(r.raw, f, 1024 * 1024)
+                os.replace(part_path, self.cover_path)
+            except (requests.RequestException, OSError) as exc:
+                if os.path.exists(part_path):
+                    os.remove(part_path)
+                # Tracks are still tagged, just without artwork
+                logger.warning(f"Cover artwork unavailable: {exc}")
+                self.cover_bytes = b""
+                return
             logger.info('Cover artwork downloaded.')
+        # Read once, embedded into every track
+        with open(self.cover_path, 'rb') as f:
+            self.cover_bytes = f.read()
+        # FLAC picture block is identical for every track
+        self._flac_picture = Picture()
+        self._flac_picture.type = 3
+        self._flac_picture.desc = 'Front Cover'
+        self._flac_picture.mime = 'image/jpeg'
+        self._flac_picture.data = self.cover_bytes
     
-    @logger.catch
-    def _tag(self, track: dict, file_path: str):
+    def _tag(self, track: dict, file_path: str, lyrics: str):
         """Append ID3/FLAC tags
 
         Args:
             track (dict): API response containing track information
             file_path (str): File being tagged
+            lyrics (str): Formatted lyrics
         """
-        lyrics = self._get_lyrics(track['track_id'], track['lyrics_tp'])
+        # Cover artwork may still be downloading
+        self._cover.result()
         tags = track_to_flac(track, self.album, lyrics)
         if str(file_path).endswith('.flac'):
             f_file = FLAC(file_path)
             # Add cover artwork to flac file
             f_file.clear_pictures() # Delete existing cover artwork
-            if self.cover_path:
-                f_image = Picture()
-                f_image.type = 3
-                f_image.desc = 'Front Cover'
-                with open(self.cover_path, 'rb') as f:
-                    f_image.data = f.read()
-                f_file.add_picture(f_image)
+            if self.cover_bytes:
+                f_file.add_picture(self._flac_picture)
             logger.debug(f"Writing tags to {file_path}")
             for k, v in tags.items():
                 f_file[k] = str(v)
-            f_file.save()
+            f_file.save(padding=partial(_padding, reserve=64 * 1024))
         if str(file_path).endswith('.mp3'):
-            # Legend contains all ID3 tags for each FLAC header.
-            legend = {
-                "ALBUM": id3.TALB,
-                "ALBUMARTIST": id3.TPE2,
-                "ARTIST": id3.TPE1,
-                "COMMENT": id3.COMM,
-                "COMPOSER": id3.TCOM,
-                "COPYRIGHT": id3.TCOP,
-                "DATE": id3.TDRC,
-                "GENRE": id3.TCON,
-                "ISRC": id3.TSRC,
-                "LABEL": id3.TPUB,
-                "PERFORMER": id3.TOPE,
-                "TITLE": id3.TIT2,
-                "LYRICS": id3.USLT
-            }
             try:
                 m_file = id3.ID3(file_path)
             except ID3NoHeaderError:
@@ -261,7 +476,7 @@ class Download:
             # Apply tags using the legend
             for k, v in tags.items():
                 try:
-                    id3tag = legend[k]
+                    id3tag = _ID3_LEGEND[k]
                     m_file[id3tag.__name__] = id3tag(encoding=3, text=v)
                 except KeyError:
                     continue
@@ -270,10 +485,9 @@ class Download:
             m_file.add(id3.TPOS(encoding=3, text=f"{track['disc_id']}/{self.album['disc_total']}"))
             # Apply cover artwork
             m_file.delall("APIC") # Delete existing cover artwork
-            if self.cover_path:
-                with open(self.cover_path, 'rb') as cov_obj:
-                    m_file.add(id3.APIC(3, 'image/jpg', 3, '', cov_obj.read()))
-            m_file.save(file_path, 'v2_version=3')
+            if self.cover_bytes:
+                m_file.add(id3.APIC(3, 'image/jpeg', 3, '', self.cover_bytes))
+            m_file.save(file_path, v2_version=3, padding=partial(_padding, reserve=8 * 1024))
 
     def _get_lyrics(self, track_id: int, lyrics_tp: str) -> str:
         """Retrieves and formats track lyrics
@@ -285,22 +499,55 @@ class Download:
         Returns:
             str: Formatted lyrics
         """
+        url = self._lyrics_url(track_id, lyrics_tp)
+        # If unavailable leave as empty string
+        if url is None:
+            return ""
+        # Same preference _lyrics_url() used to pick the endpoint
+        timed = bool(lyrics_tp and self.settings['timed_lyrics'])
+        # A failed lyrics request must not leave a renamed track untagged
+        try:
+            r = self.session.get(url)
+            r.raise_for_status()
+            return self._parse_lyrics(r, timed=timed)
+        except (requests.RequestException, ValueError) as exc:
+            logger.warning(f"Lyrics unavailable for {track_id}: {exc}")
+            return ""
+
+    def _lyrics_url(self, track_id: int, lyrics_tp: str) -> Optional[str]:
+        """Returns the lyrics URL for the preferred lyrics type
+
+        Args:
+            track_id (int): Unique track ID.
+            lyrics_tp (str): 'T'/'N': Timed/Normal lyrics from settings.
+
+        Returns:
+            str: Lyrics URL, None if the track has no lyrics
+        """
+        if lyrics_tp is None:
+            return None
         # If user prefers timed then retrieve timed lyrics
         if lyrics_tp and self.settings['timed_lyrics']:
-            # Retrieve timed lyrics
-            r = requests.get(f"https://music.bugs.co.kr/player/lyrics/T/{track_id}")
+            return f"https://music.bugs.co.kr/player/lyrics/T/{track_id}"
+        # If user prefers untimed or timed unavailable then use untimed
+        return f"https://music.bugs.co.kr/player/lyrics/N/{track_id}"
+
+    @staticmethod
+    def _parse_lyrics(r: requests.Response, timed: bool) -> str:
+        """Formats a lyrics response
+
+        Args:
+            r (requests.Response): Response from the lyrics endpoint
+            timed (bool): Whether the response contains timed lyrics
+
+        Returns:
+            str: Formatted lyrics
+        """
+        lyrics = r.json()['lyrics']
+        if timed:
             # Format timed lyrics
-            lyrics = r.json()['lyrics'].replace("＃", "\n")
+            lyrics = lyrics.replace("＃", "\n")
             line_split = (line.split('|') for line in lyrics.splitlines())
             lyrics = ("\n".join(
-                f'[{datetime.fromtimestamp(round(float(a), 2)).strftime("%M:%S.%f")[0:-4]}]{b}' for a, b in line_split))
-        # If user prefers untimed or timed unavailable then use untimed
-        elif not lyrics_tp or not self.settings['timed_lyrics']:
-            r = requests.get(f'https://music.bugs.co.kr/player/lyrics/N/{track_id}')
-            lyrics = r.json()['lyrics']
-            # If unavailable leave as empty string
-            if lyrics_tp is None:
-                lyrics = ""
-        else:
-            lyrics = ""
+                f'[{_lrc_timestamp(a)}]{b}' for a, b in line_split))
         return lyrics
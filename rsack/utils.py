@@ -1,7 +1,7 @@
 import os
 from sys import exit
 from platform import system
-from re import match, sub
+from re import match
 from datetime import datetime
 from loguru import logger
 from configparser import ConfigParser
@@ -33,6 +33,8 @@ class Settings:
                           "timed_lyrics": "true",
                           "contributions": "false",
                           "cover_size": "original",
+                          "chunk_size": "1048576",
+                          "segments": "1",
                           "template": "/{artist}/{artist} - {title}"}
         
         config['Genie'] = {'username': "username",
@@ -185,12 +187,17 @@ def _is_win() -> bool:
 	if system() == 'Windows':
 		return True
 
+# Characters replaced by sanitize(), resolved once for the running Operating System
+if _is_win():
+    _SANITIZE_TABLE = str.maketrans(dict.fromkeys('/:*?"><|', '_'))
+    _SANITIZE_STRIP = '. '
+else:
+    _SANITIZE_TABLE = str.maketrans('/', '_')
+    _SANITIZE_STRIP = None
+
 def sanitize(fn: str) -> str:
     """Sanitizes filenames based on Operating System"""
-    if _is_win():
-        return sub(r'[\/:*?"><|]', '_', fn).strip('. ')
-    else:
-        return sub('/', '_', fn).strip()
+    return fn.translate(_SANITIZE_TABLE).strip(_SANITIZE_STRIP)
 
 def contribution_check(artist_id_provided: int, artist_id_api: int) -> bool:
     """Checks if artist is contributing"""